@@ -0,0 +1,25 @@
+"""
+HoopsHype TV — Gunicorn settings
+Used by `python server.py`, or directly:
+  gunicorn -c gunicorn_conf.py server:app
+"""
+
+import json
+import sys
+from pathlib import Path
+
+with open(Path(__file__).parent / "config.json") as f:
+    _server = json.load(f)["server"]
+
+bind = f"{_server['host']}:{_server['port']}"
+
+# The cache and its refresh loop live in-process, so there is exactly one
+# worker; its threads serve the pre-serialized responses concurrently.
+workers = 1
+threads = 8
+worker_class = "gthread"
+
+
+def post_worker_init(worker):
+    """Start the background refresh inside the worker that serves the cache."""
+    sys.modules[worker.wsgi.import_name].start_refresh()
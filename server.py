@@ -7,16 +7,24 @@ Endpoints:
   GET /api/health      — server health check
 """
 
+import re
 import json
 import time
+import asyncio
+import hashlib
 import logging
-import traceback
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Thread, Lock
+from threading import Thread
 
-from flask import Flask, jsonify
+import orjson
+import requests
+from flask import Flask, Response, request
 from flask_cors import CORS
+from lxml import etree, html as lxml_html
 
 # ── Config ──────────────────────────────────────────────
 CONFIG_PATH = Path(__file__).parent / "config.json"
@@ -41,78 +49,95 @@ app = Flask(__name__, static_folder="static")
 CORS(app)
 
 # ── Cache ───────────────────────────────────────────────
+# Each entry holds the fully-serialized response body, built once per refresh
+# so the API routes only hand out bytes. Entries are immutable and replaced
+# wholesale by the refresh thread, so readers never need a lock.
+# `updated` is the time of the last successful fetch; `failures` counts the
+# refreshes that have failed since then; `max_age` is the Cache-Control TTL
+# picked from CACHE_POLICIES for that data.
+CacheEntry = namedtuple("CacheEntry", "data body updated count etag failures max_age")
+
+CACHE_POLICIES = CFG["cache_policies"]
+
+
+def _cache_max_age(key, data):
+    """Pick the client cache TTL for a fresh payload: short while games are live."""
+    if key == "games":
+        if any(g["status"] == "live" for g in data):
+            return CACHE_POLICIES["games_live_sec"]
+        if any(g["status"] == "upcoming" for g in data):
+            return CACHE_POLICIES["games_upcoming_sec"]
+        return CACHE_POLICIES["games_final_sec"]
+    return CACHE_POLICIES[f"{key}_sec"]
+
+
+def _serialize(key, data, updated, failures=0):
+    """Serialize a cache payload and return (body, etag)."""
+    stale = failures > 0
+    body = orjson.dumps({
+        key: data,
+        "updated": updated,
+        "count": len(data),
+        "stale": stale,
+        "stale_seconds": round(time.time() - updated) if stale and updated else None,
+    })
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _empty_entry(key):
+    body, etag = _serialize(key, [], 0)
+    return CacheEntry([], body, 0, 0, etag, 0, 0)
+
+
+def _store(key, data):
+    """Swap in a fresh entry for key."""
+    updated = time.time()
+    body, etag = _serialize(key, data, updated)
+    cache[key] = CacheEntry(data, body, updated, len(data), etag, 0, _cache_max_age(key, data))
+
+
+def _store_failure(key):
+    """Keep serving the last good data for key, flagged as stale."""
+    entry = cache[key]
+    failures = entry.failures + 1
+    body, etag = _serialize(key, entry.data, entry.updated, failures)
+    cache[key] = entry._replace(body=body, etag=etag, failures=failures)
+
+
 cache = {
-    "games": {"data": [], "updated": 0},
-    "headlines": {"data": [], "updated": 0},
+    "games": _empty_entry("games"),
+    "headlines": _empty_entry("headlines"),
 }
-cache_lock = Lock()
 
 
 # ═══════════════════════════════════════════════════════
 # NBA API — Live Scores
 # ═══════════════════════════════════════════════════════
 
+# Regulation periods; anything past the 4th is shown as OT1, OT2, ...
+ORDINAL = ("0th", "1st", "2nd", "3rd", "4th")
+
+# Live API durations look like "PT05M07.00S"; player minutes may also come
+# as "25", "25:30" or "25.5", so only the leading minute count is kept.
+_CLOCK_RE = re.compile(r"PT(?P<m>\d+)M(?P<s>[\d.]+)S")
+_MINUTES_RE = re.compile(r"\s*(?:PT)?(\d+)")
+
+
 def fetch_games():
     """Fetch today's games from nba_api and return structured data."""
     try:
         from nba_api.live.nba.endpoints import scoreboard
         sb = scoreboard.ScoreBoard()
-        data = sb.get_dict()
-        games = data.get("scoreboard", {}).get("games", [])
+        # ScoreBoard already parsed the response into its games dataset;
+        # sb.get_dict() would re-parse the whole raw payload a second time.
+        games_ds = getattr(sb, "games", None)
+        games = games_ds.get_dict() if games_ds is not None else []
 
         result = []
         for g in games:
             home = g.get("homeTeam", {})
             away = g.get("awayTeam", {})
-
-            def parse_team(t, periods_data):
-                # Leaders
-                leaders = {}
-                for cat_key, cat_name in [("points", "pts"), ("rebounds", "reb"), ("assists", "ast")]:
-                    # Leaders come from different structure in live API
-                    leaders[cat_name] = {"p": "—", "v": 0}
-
-                # Try to get leaders from gameLeaders
-                game_leaders = g.get("gameLeaders", {})
-                if game_leaders:
-                    for api_key, our_key in [("homeLeaders", "home"), ("awayLeaders", "away")]:
-                        if api_key in game_leaders:
-                            ld = game_leaders[api_key]
-                            side_leaders = {}
-                            if "points" in ld:
-                                side_leaders["pts"] = {"p": ld.get("name", "—"), "v": ld.get("points", 0)}
-                            if "rebounds" in ld:
-                                side_leaders["reb"] = {"p": ld.get("name", "—"), "v": ld.get("rebounds", 0)}
-                            if "assists" in ld:
-                                side_leaders["ast"] = {"p": ld.get("name", "—"), "v": ld.get("assists", 0)}
-                            if our_key == ("home" if t == home else "away"):
-                                leaders.update(side_leaders)
-
-                # Periods/quarters
-                periods = t.get("periods", [])
-                quarters = [p.get("score", 0) for p in periods] if periods else []
-                # Pad to 4 quarters
-                while len(quarters) < 4:
-                    quarters.append(0)
-
-                # Team stats
-                stats = t.get("statistics", {})
-
-                return {
-                    "abbr": t.get("teamTricode", "???"),
-                    "city": t.get("teamCity", ""),
-                    "name": t.get("teamName", ""),
-                    "record": f"{t.get('wins', 0)}-{t.get('losses', 0)}",
-                    "score": t.get("score", 0),
-                    "quarters": quarters[:4],
-                    "leaders": leaders,
-                    "splits": {
-                        "fg": _pct(stats.get("fieldGoalsMade", 0), stats.get("fieldGoalsAttempted", 0)),
-                        "tp": _pct(stats.get("threePointersMade", 0), stats.get("threePointersAttempted", 0)),
-                        "ft": _pct(stats.get("freeThrowsMade", 0), stats.get("freeThrowsAttempted", 0)),
-                    },
-                    "players": _parse_players(t.get("players", [])),
-                }
+            leaders_by_side = _extract_leaders(g.get("gameLeaders", {}))
 
             # Game status
             status_num = g.get("gameStatus", 1)
@@ -125,20 +150,9 @@ def fetch_games():
                 clock = ""
             elif status_num == 2:
                 status = "live"
-                clock_str = g.get("gameClock", "").replace("PT", "").replace("M", ":").replace("S", "").strip()
-                # Format clock nicely
-                if clock_str and clock_str != "":
-                    try:
-                        parts = clock_str.split(":")
-                        mins = int(float(parts[0])) if parts[0] else 0
-                        secs = int(float(parts[1])) if len(parts) > 1 and parts[1] else 0
-                        clock = f"{mins}:{secs:02d}"
-                    except:
-                        clock = clock_str
-                else:
-                    clock = "0:00"
-                ordinal = lambda n: f"{n}{'th' if 11<=n<=13 else {1:'st',2:'nd',3:'rd'}.get(n%10,'th')}"
-                period_str = f"{ordinal(period)} Qtr" if period <= 4 else f"OT{period-4}" if period > 4 else ""
+                m = _CLOCK_RE.match(g.get("gameClock", ""))
+                clock = f"{int(m['m'])}:{int(float(m['s'])):02d}" if m else "0:00"
+                period_str = f"{ORDINAL[period]} Qtr" if period <= 4 else f"OT{period-4}"
             else:
                 status = "final"
                 period_str = "Final" if period <= 4 else f"Final/OT{period-4}"
@@ -150,23 +164,97 @@ def fetch_games():
                 "period": period_str,
                 "clock": clock,
                 "arena": g.get("arenaName", ""),
-                "away": parse_team(away, g),
-                "home": parse_team(home, g),
+                "away": _parse_team(away, "away", leaders_by_side),
+                "home": _parse_team(home, "home", leaders_by_side),
             })
 
         log.info(f"Fetched {len(result)} games from nba_api")
         return result
 
-    except Exception as e:
-        log.error(f"Error fetching games: {e}\n{traceback.format_exc()}")
+    except Exception:
+        log.exception("Error fetching games")
         return None
 
 
+def _extract_leaders(game_leaders):
+    """Split gameLeaders into {"home": {...}, "away": {...}} stat leaders."""
+    return {
+        "home": _side_leaders(game_leaders.get("homeLeaders") or {}),
+        "away": _side_leaders(game_leaders.get("awayLeaders") or {}),
+    }
+
+
+def _side_leaders(ld):
+    """Build one side's pts/reb/ast leaders, with placeholders when missing."""
+    name = ld.get("name", "—")
+    return {
+        "pts": {"p": name, "v": ld["points"]} if "points" in ld else {"p": "—", "v": 0},
+        "reb": {"p": name, "v": ld["rebounds"]} if "rebounds" in ld else {"p": "—", "v": 0},
+        "ast": {"p": name, "v": ld["assists"]} if "assists" in ld else {"p": "—", "v": 0},
+    }
+
+
+def _parse_team(t, side, leaders_by_side):
+    """Parse one side of a game ("home"/"away") into overlay team data."""
+    # Periods/quarters, padded to 4
+    quarters = [p.get("score", 0) for p in t.get("periods", [])[:4]]
+    quarters += [0] * (4 - len(quarters))
+
+    # Team stats
+    stats = t.get("statistics", {})
+
+    return {
+        "abbr": t.get("teamTricode", "???"),
+        "city": t.get("teamCity", ""),
+        "name": t.get("teamName", ""),
+        "record": f"{t.get('wins', 0)}-{t.get('losses', 0)}",
+        "score": t.get("score", 0),
+        "quarters": quarters,
+        "leaders": leaders_by_side[side],
+        "splits": {
+            "fg": _pct(stats.get("fieldGoalsMade", 0), stats.get("fieldGoalsAttempted", 0)),
+            "tp": _pct(stats.get("threePointersMade", 0), stats.get("threePointersAttempted", 0)),
+            "ft": _pct(stats.get("freeThrowsMade", 0), stats.get("freeThrowsAttempted", 0)),
+        },
+        "players": _parse_players(t.get("players", [])),
+    }
+
+
+def _games_interval(games):
+    """Pick the delay before the next games refresh from today's slate.
+
+    Live games poll at refresh_interval_sec; otherwise the cadence backs off
+    to upcoming/final/idle intervals and pauses through the quiet hours.
+    """
+    cfg = CFG["nba_api"]
+    if any(g["status"] == "live" for g in games):
+        return cfg["refresh_interval_sec"]
+
+    quiet_start, quiet_end = cfg["quiet_hours"]
+    now = datetime.now()
+    if quiet_start <= now.hour < quiet_end:
+        wake = now.replace(hour=quiet_end, minute=0, second=0, microsecond=0)
+        return (wake - now).total_seconds()
+
+    if any(g["status"] == "upcoming" for g in games):
+        return cfg["upcoming_interval_sec"]
+    if games:
+        return cfg["final_interval_sec"]
+    return cfg["idle_interval_sec"]
+
+
 def _pct(made, attempted):
-    """Calculate shooting percentage."""
+    """Calculate shooting percentage, to one decimal (integer math, ties round up)."""
     if attempted == 0:
         return 0.0
-    return round((made / attempted) * 100, 1)
+    return ((made * 1000 + (attempted >> 1)) // attempted) / 10
+
+
+# Column order of the per-player rows summed into team totals
+TOTAL_FIELDS = (
+    "min", "pts", "fgm", "fga", "tpm", "tpa", "ftm", "fta",
+    "or", "dr", "reb", "ast", "stl", "blk", "to", "pf",
+)
 
 
 def _parse_players(players_data):
@@ -175,11 +263,8 @@ def _parse_players(players_data):
     bench = []
     dnp = []
 
-    totals = {
-        "min": 0, "pts": 0, "fg": [0, 0], "tp": [0, 0], "ft": [0, 0],
-        "or": 0, "dr": 0, "reb": 0, "ast": 0, "stl": 0, "blk": 0,
-        "to": 0, "pf": 0, "pm": "",
-    }
+    # One row of TOTAL_FIELDS per player, summed column-wise at the end
+    rows = []
 
     for p in players_data:
         stats = p.get("statistics", {})
@@ -224,20 +309,11 @@ def _parse_players(players_data):
             "pm": _format_pm(stats.get("plusMinusPoints", 0)),
         }
 
-        # Update totals
-        totals["min"] += min_val
-        totals["pts"] += player_obj["pts"]
-        totals["fg"][0] += fgm; totals["fg"][1] += fga
-        totals["tp"][0] += tpm; totals["tp"][1] += tpa
-        totals["ft"][0] += ftm; totals["ft"][1] += fta
-        totals["or"] += player_obj["or"]
-        totals["dr"] += player_obj["dr"]
-        totals["reb"] += player_obj["reb"]
-        totals["ast"] += player_obj["ast"]
-        totals["stl"] += player_obj["stl"]
-        totals["blk"] += player_obj["blk"]
-        totals["to"] += player_obj["to"]
-        totals["pf"] += player_obj["pf"]
+        rows.append((
+            min_val, player_obj["pts"], fgm, fga, tpm, tpa, ftm, fta,
+            player_obj["or"], player_obj["dr"], player_obj["reb"], player_obj["ast"],
+            player_obj["stl"], player_obj["blk"], player_obj["to"], player_obj["pf"],
+        ))
 
         starter = p.get("starter", "0")
         if starter == "1":
@@ -246,21 +322,23 @@ def _parse_players(players_data):
             bench.append(player_obj)
 
     # Format totals
+    totals = dict.fromkeys(TOTAL_FIELDS, 0)
+    totals.update(zip(TOTAL_FIELDS, map(sum, zip(*rows))))
     totals_formatted = {
         "min": totals["min"],
         "pts": totals["pts"],
-        "fg": f"{totals['fg'][0]}-{totals['fg'][1]}",
-        "tp": f"{totals['tp'][0]}-{totals['tp'][1]}",
-        "ft": f"{totals['ft'][0]}-{totals['ft'][1]}",
+        "fg": f"{totals['fgm']}-{totals['fga']}",
+        "tp": f"{totals['tpm']}-{totals['tpa']}",
+        "ft": f"{totals['ftm']}-{totals['fta']}",
         "or": totals["or"], "dr": totals["dr"], "reb": totals["reb"],
         "ast": totals["ast"], "stl": totals["stl"], "blk": totals["blk"],
         "to": totals["to"], "pf": totals["pf"], "pm": "",
     }
 
     pcts = {
-        "fg": f"{_pct(totals['fg'][0], totals['fg'][1])}%",
-        "tp": f"{_pct(totals['tp'][0], totals['tp'][1])}%",
-        "ft": f"{_pct(totals['ft'][0], totals['ft'][1])}%",
+        "fg": f"{_pct(totals['fgm'], totals['fga'])}%",
+        "tp": f"{_pct(totals['tpm'], totals['tpa'])}%",
+        "ft": f"{_pct(totals['ftm'], totals['fta'])}%",
     }
 
     return {
@@ -272,27 +350,26 @@ def _parse_players(players_data):
     }
 
 
+@functools.lru_cache(maxsize=4096)
 def _short_name(full):
     """Convert 'Jayson Tatum' → 'J. Tatum'."""
-    parts = full.strip().split()
-    if len(parts) >= 2:
-        return f"{parts[0][0]}. {' '.join(parts[1:])}"
+    first, sep, rest = full.strip().partition(" ")
+    rest = rest.lstrip()
+    if sep and rest:
+        return f"{first[0]}. {rest}"
     return full
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_minutes(val):
     """Parse minutes from various formats."""
     if isinstance(val, (int, float)):
         return int(val)
-    s = str(val).replace("PT", "").replace("M", "").replace("S", "").strip()
-    try:
-        if ":" in s:
-            return int(s.split(":")[0])
-        return int(float(s))
-    except:
-        return 0
+    m = _MINUTES_RE.match(str(val))
+    return int(m.group(1)) if m else 0
 
 
+@functools.lru_cache(maxsize=4096, typed=True)  # 5 and 5.0 format differently
 def _format_pm(val):
     """Format plus/minus with sign."""
     if val > 0:
@@ -306,32 +383,63 @@ def _format_pm(val):
 # HOOPSHYPE HEADLINES SCRAPER
 # ═══════════════════════════════════════════════════════
 
+def _cls(name):
+    """XPath predicate equivalent to the CSS class selector '.name'."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# HoopsHype rumors are typically in article/post elements.
+# Adjust selectors based on actual page structure; the first one that
+# matches anything wins, the last is a broad fallback.
+HEADLINE_XPATHS = (
+    etree.XPath(
+        f"//div[{_cls('post-data')}]//h2//a"
+        f" | //div[{_cls('post-loop')}]//h2//a"
+        " | //article//h2//a"
+        f" | //*[{_cls('rumor-title')}]//a"
+        f" | //h2[{_cls('entry-title')}]//a"
+    ),
+    etree.XPath("//h2//a | //h3//a"),
+)
+
+# Validators from the last successful scrape. They are sent back as a
+# conditional GET so an unchanged rumors page costs a 304 and no parsing.
+_hh_last = {"etag": None, "last_modified": None, "headlines": None}
+
+# Shared keep-alive session so each scrape reuses the connection to HoopsHype
+_hh_session = requests.Session()
+_hh_session.headers["User-Agent"] = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+
 def fetch_headlines():
     """Scrape headlines from HoopsHype rumors page."""
     try:
-        import requests
-        from bs4 import BeautifulSoup
-
         url = CFG["hoopshype_ticker"]["url"]
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        resp = requests.get(url, headers=headers, timeout=10)
+        headers = {}
+        if _hh_last["headlines"] is not None:
+            if _hh_last["etag"]:
+                headers["If-None-Match"] = _hh_last["etag"]
+            if _hh_last["last_modified"]:
+                headers["If-Modified-Since"] = _hh_last["last_modified"]
+        resp = _hh_session.get(url, headers=headers, timeout=10)
+
+        if resp.status_code == 304 and _hh_last["headlines"] is not None:
+            log.info("HoopsHype rumors unchanged (304), reusing headlines")
+            return _hh_last["headlines"]
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Hand lxml the raw bytes; it detects the page encoding itself
+        tree = lxml_html.fromstring(resp.content)
         headlines = []
 
-        # HoopsHype rumors are typically in article/post elements
-        # Adjust selectors based on actual page structure
-        articles = soup.select("div.post-data h2 a, div.post-loop h2 a, article h2 a, .rumor-title a, h2.entry-title a")
-
-        if not articles:
-            # Fallback: try broader selectors
-            articles = soup.select("h2 a, h3 a")
+        articles = []
+        for xpath in HEADLINE_XPATHS:
+            articles = xpath(tree)
+            if articles:
+                break
 
         for a in articles[:CFG["hoopshype_ticker"]["max_headlines"]]:
-            text = a.get_text(strip=True)
+            text = a.text_content().strip()
             if text and len(text) > 15:  # Skip very short items
                 headlines.append({
                     "t": text,
@@ -339,66 +447,114 @@ def fetch_headlines():
                     "url": a.get("href", ""),
                 })
 
+        _hh_last.update(
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            headlines=headlines,
+        )
         log.info(f"Scraped {len(headlines)} headlines from HoopsHype")
         return headlines
 
-    except Exception as e:
-        log.error(f"Error scraping headlines: {e}\n{traceback.format_exc()}")
+    except Exception:
+        log.exception("Error scraping headlines")
         return None
 
 
 # ═══════════════════════════════════════════════════════
-# BACKGROUND REFRESH THREADS
+# BACKGROUND REFRESH
 # ═══════════════════════════════════════════════════════
 
-def refresh_loop(key, fetch_fn, interval_sec):
-    """Generic background refresh loop."""
-    while True:
+# nba_api and requests are blocking, so fetchers run on a small pool sized
+# to the number of feeds while one event loop schedules all of them.
+_fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch")
+
+
+def schedule_refresh(loop, key, fetch_fn, interval_sec, next_interval=None):
+    """Run one background refresh of key, then schedule the next one.
+
+    There is no sleeping loop: each finished fetch books the following one
+    with loop.call_later. If next_interval is given, it is called with each
+    fresh result and returns that delay; failures retry after interval_sec.
+    """
+    def on_done(future):
+        delay = interval_sec
         try:
-            data = fetch_fn()
+            data = future.result()
             if data is not None:
-                with cache_lock:
-                    cache[key]["data"] = data
-                    cache[key]["updated"] = time.time()
+                _store(key, data)
+                if next_interval is not None:
+                    delay = next_interval(data)
+            else:
+                _store_failure(key)
         except Exception as e:
             log.error(f"Refresh error [{key}]: {e}")
-        time.sleep(interval_sec)
+            _store_failure(key)
+        loop.call_later(delay, schedule_refresh, loop, key, fetch_fn, interval_sec, next_interval)
+
+    loop.run_in_executor(_fetch_pool, fetch_fn).add_done_callback(on_done)
+
+
+def _run_refresh():
+    loop = asyncio.new_event_loop()
+    loop.call_soon(
+        schedule_refresh, loop, "games", fetch_games,
+        CFG["nba_api"]["refresh_interval_sec"], _games_interval,
+    )
+    loop.call_soon(
+        schedule_refresh, loop, "headlines", fetch_headlines,
+        CFG["hoopshype_ticker"]["refresh_interval_sec"],
+    )
+    loop.run_forever()
+
+
+def start_refresh():
+    """Run every feed's refresh schedule on a single background event-loop thread."""
+    Thread(target=_run_refresh, name="refresh", daemon=True).start()
 
 
 # ═══════════════════════════════════════════════════════
 # ROUTES
 # ═══════════════════════════════════════════════════════
 
+def _cached_response(key):
+    """Serve a pre-serialized cache entry, honoring If-None-Match.
+
+    After a failed refresh the last good data is still served, flagged stale;
+    if no fetch has ever succeeded the response is a 503.
+    """
+    entry = cache[key]
+    if entry.failures and not entry.updated:
+        return Response(entry.body, status=503, mimetype="application/json")
+    resp = Response(entry.body, mimetype="application/json")
+    resp.set_etag(entry.etag)
+    resp.headers["Cache-Control"] = (
+        f"public, max-age={entry.max_age}, stale-while-revalidate={entry.max_age * 2}"
+    )
+    return resp.make_conditional(request)
+
+
 @app.route("/api/games")
 def api_games():
-    with cache_lock:
-        return jsonify({
-            "games": cache["games"]["data"],
-            "updated": cache["games"]["updated"],
-            "count": len(cache["games"]["data"]),
-        })
+    return _cached_response("games")
 
 
 @app.route("/api/headlines")
 def api_headlines():
-    with cache_lock:
-        return jsonify({
-            "headlines": cache["headlines"]["data"],
-            "updated": cache["headlines"]["updated"],
-            "count": len(cache["headlines"]["data"]),
-        })
+    return _cached_response("headlines")
 
 
 @app.route("/api/health")
 def api_health():
-    with cache_lock:
-        now = time.time()
-        return jsonify({
-            "status": "ok",
-            "uptime_sec": round(now - START_TIME),
-            "games_age_sec": round(now - cache["games"]["updated"]) if cache["games"]["updated"] else None,
-            "headlines_age_sec": round(now - cache["headlines"]["updated"]) if cache["headlines"]["updated"] else None,
-        })
+    now = time.time()
+    games, headlines = cache["games"], cache["headlines"]
+    return Response(orjson.dumps({
+        "status": "ok",
+        "uptime_sec": round(now - START_TIME),
+        "games_age_sec": round(now - games.updated) if games.updated else None,
+        "headlines_age_sec": round(now - headlines.updated) if headlines.updated else None,
+        "games_failures": games.failures,
+        "headlines_failures": headlines.failures,
+    }), mimetype="application/json", headers={"Cache-Control": "no-store"})
 
 
 @app.route("/")
@@ -413,24 +569,21 @@ def index():
 START_TIME = time.time()
 
 if __name__ == "__main__":
-    log.info("Starting HoopsHype Loop server...")
+    from gunicorn.app.base import BaseApplication
 
-    # Start background threads
-    Thread(
-        target=refresh_loop,
-        args=("games", fetch_games, CFG["nba_api"]["refresh_interval_sec"]),
-        daemon=True,
-    ).start()
+    import gunicorn_conf
 
-    Thread(
-        target=refresh_loop,
-        args=("headlines", fetch_headlines, CFG["hoopshype_ticker"]["refresh_interval_sec"]),
-        daemon=True,
-    ).start()
+    class StandaloneServer(BaseApplication):
+        """Run the app under gunicorn with the settings in gunicorn_conf.py."""
 
+        def load_config(self):
+            for key, value in vars(gunicorn_conf).items():
+                if key in self.cfg.settings:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    log.info("Starting HoopsHype Loop server...")
     log.info(f"Server running on http://{CFG['server']['host']}:{CFG['server']['port']}")
-    app.run(
-        host=CFG["server"]["host"],
-        port=CFG["server"]["port"],
-        debug=False,
-    )
+    StandaloneServer().run()